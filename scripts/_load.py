@@ -0,0 +1,53 @@
+"""
+Shared loader for the parsed model list.
+The CSV is parsed once and cached next to it as Parquet (with avg_cost
+precomputed), so later runs read typed columns instead of re-tokenizing text.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "parsed"
+CSV_PATH = DATA_DIR / "all-models.csv"
+PARQUET_PATH = DATA_DIR / "all-models.parquet"
+
+
+def load_models(columns=None):
+    """
+    Load all models with avg_cost, preferring the Parquet cache when fresh.
+
+    columns limits the result to those columns; with Parquet only their
+    column chunks are read from disk.
+    """
+    try:
+        if PARQUET_PATH.stat().st_mtime >= CSV_PATH.stat().st_mtime:
+            return pd.read_parquet(PARQUET_PATH, engine='pyarrow', columns=columns)
+    except (ImportError, ValueError, OSError):
+        # No cache yet, a corrupt one, or pyarrow isn't installed: use the CSV
+        pass
+
+    # 'high' is pandas' default float converter, spelled out so it isn't swapped
+    # for the much slower 'round_trip' mode
+    df = pd.read_csv(
+        CSV_PATH,
+        engine='c',
+        float_precision='high',
+        dtype={'input_price_usd_per_m': np.float64, 'output_price_usd_per_m': np.float64}
+    )
+
+    # Calculate average cost (input + output) / 2
+    df['avg_cost'] = (df['input_price_usd_per_m'] + df['output_price_usd_per_m']) / 2
+
+    # Write to a temp file and swap it in, so an interrupted write never leaves
+    # a truncated cache that looks fresh; an unwritable cache is just skipped
+    tmp_path = DATA_DIR / f".{PARQUET_PATH.stem}.{os.getpid()}.tmp.parquet"
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, PARQUET_PATH)
+    except (ImportError, ValueError, OSError):
+        tmp_path.unlink(missing_ok=True)
+
+    return df if columns is None else df[columns]
@@ -0,0 +1,73 @@
+"""
+Shared quadrant assignment for the cost vs context window analysis.
+Models are split at the median context length and median average cost of
+the paid models.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Order: low cost/high context, high cost/high context, low cost/low context, high cost/low context
+QUADRANT_LABELS = (
+    'Low Cost / High Context',
+    'High Cost / High Context',
+    'Low Cost / Low Context',
+    'High Cost / Low Context',
+)
+
+
+def compute_quadrants(df, labels=QUADRANT_LABELS):
+    """
+    Assign each paid model to a cost/context quadrant.
+
+    Returns (df_paid, median_context, median_cost), where df_paid holds only
+    models with avg_cost > 0 plus 'quadrant' (categorical over labels) and
+    'value_score' columns.
+    """
+    # Remove models with 0 cost (free tier)
+    df_paid = df[df['avg_cost'] > 0].copy()
+
+    # Calculate median values for quadrant divisions
+    median_context = df_paid['context_length'].median()
+    median_cost = df_paid['avg_cost'].median()
+
+    low_cost = df_paid['avg_cost'] < median_cost
+    high_context = df_paid['context_length'] >= median_context
+
+    # Store int8 codes into labels rather than a string per row; comparisons
+    # against a label become integer compares and CSVs still write the label
+    codes = np.select(
+        [low_cost & high_context, ~low_cost & high_context, low_cost & ~high_context],
+        [0, 1, 2],
+        default=3
+    ).astype(np.int8)
+    df_paid['quadrant'] = pd.Categorical.from_codes(codes, categories=list(labels))
+
+    # Calculate value score (context tokens per dollar)
+    df_paid['value_score'] = df_paid['context_length'] / df_paid['avg_cost']
+
+    return df_paid, median_context, median_cost
+
+
+def top_by_value(quad_data, k):
+    """Return the k rows with the highest value_score, best first (like nlargest)."""
+    scores = quad_data['value_score'].to_numpy()
+    k = min(k, len(scores))
+
+    # NaN scores rank last, in row order, as with nlargest
+    is_nan = np.isnan(scores)
+    nan_rows = np.flatnonzero(is_nan)
+    k_valid = min(k, len(scores) - len(nan_rows))
+    if k_valid == 0:
+        return quad_data.iloc[nan_rows[:k]]
+
+    # Partial partition (O(n)) finds the k-th best score without a full sort
+    kth_score = -np.partition(-scores[~is_nan], k_valid - 1)[k_valid - 1]
+    above = np.flatnonzero(scores > kth_score)
+    # Fill the remaining slots with the earliest ties, like nlargest(keep='first')
+    ties = np.flatnonzero(scores == kth_score)[:k_valid - len(above)]
+    idx = np.concatenate([above, ties])
+
+    # Sort only the k survivors, best first, ties in row order
+    idx = idx[np.lexsort((idx, -scores[idx]))]
+    return quad_data.iloc[np.concatenate([idx, nan_rows[:k - k_valid]])]
@@ -0,0 +1,30 @@
+"""
+Shared plot style: seaborn's "whitegrid" look as plain matplotlib rcParams,
+so the chart scripts don't pay for importing seaborn just to set a style.
+"""
+
+import matplotlib.pyplot as plt
+
+# Non-default values from seaborn.axes_style("whitegrid")
+WHITEGRID_RC = {
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.labelcolor': '.15',
+    'grid.color': '.8',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans',
+                        'Bitstream Vera Sans', 'sans-serif'],
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+}
+
+
+def set_whitegrid_style():
+    """Apply the whitegrid style to matplotlib's global rcParams."""
+    plt.rcParams.update(WHITEGRID_RC)
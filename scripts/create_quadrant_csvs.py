@@ -7,47 +7,25 @@ Output:
 3. Master CSV with all models and their quadrant assignments
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
-import numpy as np
-import seaborn as sns
+from math import sqrt
+from _style import set_whitegrid_style
+from _load import load_models
+from _quadrants import compute_quadrants, top_by_value
 
 # Set style for better-looking plots
-sns.set_style("whitegrid")
+set_whitegrid_style()
 plt.rcParams['font.size'] = 10
 
-# Load data
-df = pd.read_csv('/home/daniel/repos/github/OR-Models-With-Tools-0811/data/parsed/all-models.csv')
+# Load data (avg_cost is precomputed by the shared loader)
+df = load_models()
 
-# Calculate average cost (input + output) / 2
-df['avg_cost'] = (df['input_price_usd_per_m'] + df['output_price_usd_per_m']) / 2
-
-# Remove models with 0 cost (free tier)
-df_paid = df[df['avg_cost'] > 0].copy()
-
-# Calculate median values for quadrant divisions
-median_context = df_paid['context_length'].median()
-median_cost = df_paid['avg_cost'].median()
+# Keep paid models and assign quadrants (split at the medians)
+df_paid, median_context, median_cost = compute_quadrants(df)
 
 print(f"Median context: {median_context:,.0f} tokens ({median_context/1000:.0f}K)")
 print(f"Median cost: ${median_cost:.2f}/M tokens")
 
-# Define quadrants
-def assign_quadrant(row):
-    if row['avg_cost'] < median_cost and row['context_length'] >= median_context:
-        return 'Low Cost / High Context'
-    elif row['avg_cost'] >= median_cost and row['context_length'] >= median_context:
-        return 'High Cost / High Context'
-    elif row['avg_cost'] < median_cost and row['context_length'] < median_context:
-        return 'Low Cost / Low Context'
-    else:
-        return 'High Cost / Low Context'
-
-df_paid['quadrant'] = df_paid.apply(assign_quadrant, axis=1)
-
-# Calculate value score
-df_paid['value_score'] = df_paid['context_length'] / df_paid['avg_cost']
-
 # ============================================================================
 # Save CSVs
 # ============================================================================
@@ -72,8 +50,14 @@ quadrant_info = {
     'High Cost / Low Context': {'color': '#e74c3c'}
 }
 
+# Partition the paid models by quadrant once and reuse the groups below
+quadrant_groups = dict(tuple(df_paid.groupby('quadrant', observed=True, sort=False)))
+empty_quadrant = df_paid.iloc[0:0]
+quadrant_counts = {quadrant: len(quadrant_groups.get(quadrant, empty_quadrant))
+                   for quadrant in quadrant_info}
+
 for quadrant in quadrant_info.keys():
-    quad_data = df_paid[df_paid['quadrant'] == quadrant].copy()
+    quad_data = quadrant_groups.get(quadrant, empty_quadrant)
     quad_data_sorted = quad_data.sort_values('value_score', ascending=False)
 
     filename = quadrant.lower().replace(' / ', '_').replace(' ', '_')
@@ -120,15 +104,15 @@ ax.grid(True, alpha=0.3, which='both')
 xlim = ax.get_xlim()
 ylim = ax.get_ylim()
 
-# Calculate positions (in log space, use geometric mean)
-x_low = np.exp((np.log(xlim[0]) + np.log(median_context/1000)) / 2)
-x_high = np.exp((np.log(median_context/1000) + np.log(xlim[1])) / 2)
-y_low = np.exp((np.log(ylim[0]) + np.log(median_cost)) / 2)
-y_high = np.exp((np.log(median_cost) + np.log(ylim[1])) / 2)
+# Calculate positions (in log space, the midpoint is the geometric mean)
+x_low = sqrt(xlim[0] * median_context/1000)
+x_high = sqrt(median_context/1000 * xlim[1])
+y_low = sqrt(ylim[0] * median_cost)
+y_high = sqrt(median_cost * ylim[1])
 
 # Quadrant labels with counts
 for quadrant, info in quadrant_info.items():
-    count = len(df_paid[df_paid['quadrant'] == quadrant])
+    count = quadrant_counts[quadrant]
 
     if quadrant == 'Low Cost / High Context':
         x_pos, y_pos = x_high, y_low
@@ -162,7 +146,7 @@ print("QUADRANT SUMMARY")
 print("="*70)
 
 for quadrant in quadrant_info.keys():
-    quad_data = df_paid[df_paid['quadrant'] == quadrant]
+    quad_data = quadrant_groups.get(quadrant, empty_quadrant)
     print(f"\n{quadrant}")
     print(f"  Count: {len(quad_data)}")
     print(f"  Avg Cost: ${quad_data['avg_cost'].mean():.2f}/M")
@@ -172,7 +156,7 @@ for quadrant in quadrant_info.keys():
 
     # Show top 5 models
     print("\n  Top 5 by value (context/cost):")
-    top_5 = quad_data.nlargest(5, 'value_score')[['model_name', 'vendor', 'context_length', 'avg_cost']]
+    top_5 = top_by_value(quad_data, 5)[['model_name', 'vendor', 'context_length', 'avg_cost']]
     for idx, (i, row) in enumerate(top_5.iterrows(), 1):
         print(f"    {idx}. {row['model_name']} ({row['vendor']})")
         print(f"       Context: {row['context_length']/1000:.0f}K | Cost: ${row['avg_cost']:.2f}/M")
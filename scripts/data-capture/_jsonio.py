@@ -0,0 +1,32 @@
+"""
+Shared JSON file helpers for the data-capture scripts.
+orjson is used when it is installed; otherwise the stdlib json module.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: str) -> None:
+    """Write data as indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
@@ -7,24 +7,13 @@ import json
 import sys
 from typing import List, Dict, Any
 
+import pandas as pd
+from _jsonio import load_json, dump_json
 
-def extract_vendor(model_id: str) -> str:
-    """Extract vendor from model ID (e.g., 'anthropic/claude-3' -> 'anthropic')."""
-    if "/" in model_id:
-        return model_id.split("/")[0]
-    return "Unknown"
 
-
-def get_model_params(architecture: Dict[str, Any]) -> str:
-    """Extract model parameters if available."""
-    # The API doesn't seem to provide explicit parameter counts
-    # We'll return empty string if not available
-    return ""
-
-
-def extract_condensed_model_info(model: Dict[str, Any]) -> Dict[str, Any]:
+def condense_models(models: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    Extract only the essential fields from a model object.
+    Extract only the essential fields from all model objects in one pass.
 
     Fields extracted:
     - model_name: Readable model name
@@ -36,30 +25,40 @@ def extract_condensed_model_info(model: Dict[str, Any]) -> Dict[str, Any]:
     - description: Model description
     - model_params: Model parameter count (if available)
     """
-    model_id = model.get("id", "")
-    vendor = extract_vendor(model_id)
+    if not models:
+        return []
 
-    # Get pricing information
-    pricing = model.get("pricing", {})
-    prompt_price = float(pricing.get("prompt", "0"))
-    completion_price = float(pricing.get("completion", "0"))
+    # Flatten nested pricing into pricing_prompt / pricing_completion columns
+    df = pd.json_normalize(models, sep="_").reindex(columns=[
+        "id", "pricing_prompt", "pricing_completion"
+    ])
 
-    # Convert from per-token to per-million tokens
-    input_price_m = prompt_price * 1_000_000
-    output_price_m = completion_price * 1_000_000
-
-    condensed = {
-        "model_name": model.get("name", ""),
-        "model_id": model_id,
-        "vendor": vendor,
-        "context": model.get("context_length", 0),
-        "input_price_usd_m": round(input_price_m, 4),
-        "output_price_usd_m": round(output_price_m, 4),
-        "description": model.get("description", ""),
-        "model_params": get_model_params(model.get("architecture", {}))
-    }
+    # Vendor is the model ID prefix (e.g., 'anthropic/claude-3' -> 'anthropic')
+    model_ids = df["id"].fillna("")
+    id_parts = model_ids.str.partition("/")
+    vendors = id_parts[0].where(id_parts[1] == "/", "Unknown")
 
-    return condensed
+    # Convert from per-token to per-million tokens
+    input_price_m = pd.to_numeric(df["pricing_prompt"].fillna("0")).astype(float) * 1_000_000
+    output_price_m = pd.to_numeric(df["pricing_completion"].fillna("0")).astype(float) * 1_000_000
+
+    # Pass-through fields are taken from the dicts directly: json_normalize
+    # would turn both a missing key and an explicit null into NaN, but only a
+    # missing key gets the default, and null stays null in the output (object
+    # dtype keeps None and ints as they are)
+    condensed = pd.DataFrame({
+        "model_name": pd.Series([model.get("name", "") for model in models], dtype=object),
+        "model_id": model_ids,
+        "vendor": vendors,
+        "context": pd.Series([model.get("context_length", 0) for model in models], dtype=object),
+        "input_price_usd_m": input_price_m.round(4),
+        "output_price_usd_m": output_price_m.round(4),
+        "description": pd.Series([model.get("description", "") for model in models], dtype=object),
+        # The API doesn't provide explicit parameter counts
+        "model_params": "",
+    })
+
+    return condensed.to_dict("records")
 
 
 def main():
@@ -69,17 +68,15 @@ def main():
 
     try:
         # Read the full models data
-        with open(input_file, "r") as f:
-            models = json.load(f)
+        models = load_json(input_file)
 
         print(f"Processing {len(models)} models...")
 
         # Extract condensed information
-        condensed_models = [extract_condensed_model_info(model) for model in models]
+        condensed_models = condense_models(models)
 
         # Write to output file
-        with open(output_file, "w") as f:
-            json.dump(condensed_models, f, indent=2)
+        dump_json(condensed_models, output_file)
 
         print(f"✓ Created condensed JSON with {len(condensed_models)} models")
         print(f"✓ Output saved to: {output_file}")
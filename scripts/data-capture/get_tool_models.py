@@ -5,45 +5,104 @@ Poll OpenRouter API for models that support tools/function calling.
 
 import os
 import sys
-import json
 import requests
+import urllib3
 from typing import List, Dict, Any
-
-
-def get_models_with_tools(api_key: str = None) -> List[Dict[str, Any]]:
+from _jsonio import load_json, dump_json
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    # Reading response.raw directly surfaces urllib3 and ijson errors for
+    # truncated or malformed bodies instead of requests exceptions
+    STREAM_ERRORS = (urllib3.exceptions.HTTPError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    STREAM_ERRORS = ()
+
+CACHE_DIR = ".cache"
+ETAG_CACHE_FILE = os.path.join(CACHE_DIR, "models_etag.txt")
+MODELS_CACHE_FILE = os.path.join(CACHE_DIR, "models.json")
+
+
+def fetch_models_with_tools(api_key: str = None, etag: str = None):
     """
     Fetch all models from OpenRouter API and filter for those supporting tools.
 
     Args:
         api_key: OpenRouter API key (optional, can be None for public endpoint)
+        etag: ETag of a previously cached response, sent as If-None-Match
 
     Returns:
-        List of models that support tools
+        Tuple of (models that support tools, response ETag), or None if the
+        server answered 304 Not Modified
     """
     url = "https://openrouter.ai/api/v1/models"
 
     headers = {}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
+    if etag:
+        headers["If-None-Match"] = etag
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+        # The context manager closes the streamed connection on every path
+        with requests.get(url, headers=headers, stream=True) as response:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+
+            if IJSON_AVAILABLE:
+                # Stream-parse the body one model at a time instead of building the
+                # whole response tree (ijson uses its yajl2_c backend when available)
+                response.raw.decode_content = True
+                models = ijson.items(response.raw, "data.item", use_float=True)
+            else:
+                models = response.json().get("data", [])
+
+            # Filter models that support tools (listed in supported_parameters)
+            models_with_tools = [
+                model for model in models
+                if "tools" in model.get("supported_parameters", [])
+            ]
+
+            return models_with_tools, response.headers.get("ETag")
+
+    except (requests.RequestException, *STREAM_ERRORS) as e:
+        print(f"Error fetching models: {e}", file=sys.stderr)
+        sys.exit(1)
 
-        # Filter models that support tools
-        models_with_tools = []
-        for model in data.get("data", []):
-            # Check if 'tools' is in supported_parameters
-            supported_params = model.get("supported_parameters", [])
-            if "tools" in supported_params:
-                models_with_tools.append(model)
 
-        return models_with_tools
+def get_models_with_tools(api_key: str = None) -> List[Dict[str, Any]]:
+    """
+    Fetch models that support tools, revalidating the local cache by ETag.
 
-    except requests.RequestException as e:
-        print(f"Error fetching models: {e}", file=sys.stderr)
-        sys.exit(1)
+    An unchanged model list costs a single 304 round-trip and is served from
+    the copy in .cache/ instead of being downloaded and parsed again.
+
+    Args:
+        api_key: OpenRouter API key (optional, can be None for public endpoint)
+
+    Returns:
+        List of models that support tools
+    """
+    etag = None
+    if os.path.exists(ETAG_CACHE_FILE) and os.path.exists(MODELS_CACHE_FILE):
+        with open(ETAG_CACHE_FILE, "r") as f:
+            etag = f.read().strip()
+
+    result = fetch_models_with_tools(api_key, etag)
+    if result is None:
+        print("Model list unchanged since last run, using cached copy")
+        return load_json(MODELS_CACHE_FILE)
+
+    models_with_tools, new_etag = result
+    if new_etag:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        dump_json(models_with_tools, MODELS_CACHE_FILE)
+        with open(ETAG_CACHE_FILE, "w") as f:
+            f.write(new_etag)
+
+    return models_with_tools
 
 
 def format_model_info(model: Dict[str, Any]) -> str:
@@ -91,8 +150,7 @@ def main():
 
     # Optionally save to JSON file
     output_file = "models_with_tools.json"
-    with open(output_file, "w") as f:
-        json.dump(models, f, indent=2)
+    dump_json(models, output_file)
 
     print(f"\nFull model data saved to: {output_file}")
 
@@ -5,48 +5,55 @@ Creates bar charts showing the 10 most expensive models with model names on x-ax
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; charts are only saved to disk
 import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
+import re
+from concurrent.futures import ProcessPoolExecutor
 import os
+from _style import set_whitegrid_style
 
 # Set style
-sns.set_style("whitegrid")
+set_whitegrid_style()
 plt.rcParams['figure.figsize'] = (14, 8)
 plt.rcParams['font.size'] = 10
 
-def extract_model_name(model_id):
-    """Extract a readable model name from the model ID."""
-    if pd.isna(model_id):
-        return "Unknown"
-
-    # Remove common prefixes
-    model_id = str(model_id)
-    prefixes_to_remove = [
-        'anthropic.', 'meta.', 'amazon.', 'cohere.', 'ai21.',
-        'mistral.', 'stability.', 'google.', 'openai.',
-    ]
-
-    for prefix in prefixes_to_remove:
-        if model_id.startswith(prefix):
-            model_id = model_id[len(prefix):]
-
-    # Clean up version numbers and make more readable
-    model_id = model_id.replace('-', ' ').replace('_', ' ')
-
-    # Capitalize appropriately
-    parts = model_id.split()
-    if parts:
-        # Keep version numbers lowercase, capitalize model names
-        cleaned_parts = []
-        for part in parts:
-            if part[0].isdigit() or part.startswith('v'):
-                cleaned_parts.append(part)
-            else:
-                cleaned_parts.append(part.capitalize())
-        return ' '.join(cleaned_parts)
-
-    return model_id
+# Provider prefixes stripped from model IDs before display
+MODEL_ID_PREFIXES = [
+    'anthropic.', 'meta.', 'amazon.', 'cohere.', 'ai21.',
+    'mistral.', 'stability.', 'google.', 'openai.',
+]
+# Each prefix is stripped at most once, in list order (so 'anthropic.meta.x' -> 'x')
+MODEL_ID_PREFIX_PATTERN = '^' + ''.join(f'(?:{re.escape(p)})?' for p in MODEL_ID_PREFIXES)
+
+def extract_model_names(model_ids):
+    """Extract readable model names from a Series of model IDs."""
+    # Remove common prefixes and make separators readable
+    # (positional index, so duplicate labels aren't merged by the groupby below)
+    names = model_ids.astype(str).reset_index(drop=True)
+    names = names.str.replace(MODEL_ID_PREFIX_PATTERN, '', regex=True)
+    names = names.str.replace(r'[-_]', ' ', regex=True)
+
+    # Capitalize model name words, keeping version tokens (digits / v...) as-is
+    words = names.str.split().explode().dropna()
+    words = words.where(words.str.match(r'[\dv]'), words.str.capitalize())
+    joined = words.groupby(level=0).agg(' '.join)
+
+    names = joined.reindex(names.index).fillna(names).set_axis(model_ids.index)
+    return names.where(model_ids.notna(), "Unknown")
+
+# Figure reused for every chart rendered by this process
+_figure = None
+
+def get_axes():
+    """Return this process's chart figure with freshly cleared axes."""
+    global _figure
+    if _figure is None:
+        _figure, _ = plt.subplots(figsize=(14, 8), constrained_layout=True)
+    ax = _figure.axes[0]
+    ax.clear()
+    return _figure, ax
 
 def create_visualization(csv_path, output_dir):
     """Create a bar chart visualization for a CSV file."""
@@ -97,15 +104,15 @@ def create_visualization(csv_path, output_dir):
         # Extract model names - check for both model_id and model_name columns
         if 'model_name' in df_sorted.columns:
             # Already have model_name, just clean it up
-            df_sorted['display_name'] = df_sorted['model_name'].apply(lambda x: str(x).split(': ')[-1] if ': ' in str(x) else str(x))
+            df_sorted['display_name'] = df_sorted['model_name'].astype(str).str.split(': ').str[-1]
         elif 'model_id' in df_sorted.columns:
-            df_sorted['display_name'] = df_sorted['model_id'].apply(extract_model_name)
+            df_sorted['display_name'] = extract_model_names(df_sorted['model_id'])
         else:
             print(f"Skipping {csv_path} - no model_name or model_id column")
             return
 
-        # Create the plot
-        fig, ax = plt.subplots(figsize=(14, 8))
+        # Create the plot on the reused figure
+        fig, ax = get_axes()
 
         # Create bar chart
         bars = ax.bar(range(len(df_sorted)), df_sorted[price_col], color='steelblue', edgecolor='black')
@@ -135,19 +142,26 @@ def create_visualization(csv_path, output_dir):
         ax.grid(axis='y', alpha=0.3, linestyle='--')
         ax.set_axisbelow(True)
 
-        # Adjust layout to prevent label cutoff
-        plt.tight_layout()
-
         # Save the figure
         output_path = output_dir / f"{Path(csv_path).stem}.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=300)
 
         print(f"Created: {output_path}")
 
     except Exception as e:
         print(f"Error processing {csv_path}: {str(e)}")
 
+def render_csv(csv_file, base_dir):
+    """Render one CSV into the matching folder under base_dir."""
+    # Create corresponding output directory structure
+    relative_path = csv_file.relative_to(base_dir)
+    output_dir = base_dir / relative_path.parent
+
+    # Ensure output directory exists
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    create_visualization(csv_file, output_dir)
+
 def main():
     """Main function to process all CSV files."""
     base_dir = Path(__file__).parent.parent / "analysis"
@@ -157,16 +171,9 @@ def main():
 
     print(f"Found {len(csv_files)} CSV files to process\n")
 
-    # Process each CSV file
-    for csv_file in csv_files:
-        # Create corresponding output directory structure
-        relative_path = csv_file.relative_to(base_dir)
-        output_dir = base_dir / relative_path.parent
-
-        # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        create_visualization(csv_file, output_dir)
+    # Each chart renders independently, so spread them across processes
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(render_csv, csv_files, [base_dir] * len(csv_files)))
 
     print(f"\nVisualization generation complete!")
 
@@ -6,24 +6,30 @@ Generates:
 2. Quadrant analysis plot
 """
 
-import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; charts are only saved to disk
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+from _style import set_whitegrid_style
+from _load import load_models
+from _quadrants import compute_quadrants, top_by_value
 
 # Set style for better-looking plots
-sns.set_style("whitegrid")
+set_whitegrid_style()
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 10
 
-# Load data
-df = pd.read_csv('/home/daniel/repos/github/OR-Models-With-Tools-0811/data/parsed/all-models.csv')
+# Load data (avg_cost is precomputed by the shared loader)
+df = load_models()
 
-# Calculate average cost (input + output) / 2
-df['avg_cost'] = (df['input_price_usd_per_m'] + df['output_price_usd_per_m']) / 2
-
-# Remove models with 0 cost (free tier) for better visualization
-df_paid = df[df['avg_cost'] > 0].copy()
+# Keep paid models (for better visualization) and assign quadrants
+quadrant_labels = (
+    'Low Cost / High Context\n(Budget Champions)',
+    'High Cost / High Context\n(Premium Options)',
+    'Low Cost / Low Context\n(Budget Basic)',
+    'High Cost / Low Context\n(Avoid)',
+)
+df_paid, median_context, median_cost = compute_quadrants(df, labels=quadrant_labels)
 
 print(f"Total models: {len(df)}")
 print(f"Paid models: {len(df_paid)}")
@@ -33,7 +39,7 @@ print(f"Free models: {len(df[df['avg_cost'] == 0])}")
 # Visualization 1: Full scatter plot with provider colors
 # ============================================================================
 
-fig, ax = plt.subplots(figsize=(16, 12))
+fig, ax = plt.subplots(figsize=(16, 12), constrained_layout=True)
 
 # Get unique vendors and assign colors
 vendors = df_paid['vendor'].unique()
@@ -71,9 +77,8 @@ ax.grid(True, alpha=0.3, which='both')
 ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0,
           frameon=True, shadow=True, ncol=1)
 
-plt.tight_layout()
 plt.savefig('/home/daniel/repos/github/OR-Models-With-Tools-0811/analysis/cost_vs_context_full.png',
-            dpi=300, bbox_inches='tight')
+            dpi=300)
 print("✓ Saved: analysis/cost_vs_context_full.png")
 plt.close()
 
@@ -81,29 +86,12 @@ plt.close()
 # Visualization 2: Quadrant Analysis
 # ============================================================================
 
-fig, ax = plt.subplots(figsize=(16, 12))
-
-# Calculate median values for quadrant divisions
-median_context = df_paid['context_length'].median()
-median_cost = df_paid['avg_cost'].median()
+fig, ax = plt.subplots(figsize=(16, 12), constrained_layout=True)
 
 print(f"\nQuadrant divisions:")
 print(f"Median context: {median_context:,.0f} tokens ({median_context/1000:.0f}K)")
 print(f"Median cost: ${median_cost:.2f}/M tokens")
 
-# Define quadrants and assign colors
-def assign_quadrant(row):
-    if row['avg_cost'] < median_cost and row['context_length'] >= median_context:
-        return 'Low Cost / High Context\n(Budget Champions)'
-    elif row['avg_cost'] >= median_cost and row['context_length'] >= median_context:
-        return 'High Cost / High Context\n(Premium Options)'
-    elif row['avg_cost'] < median_cost and row['context_length'] < median_context:
-        return 'Low Cost / Low Context\n(Budget Basic)'
-    else:
-        return 'High Cost / Low Context\n(Avoid)'
-
-df_paid['quadrant'] = df_paid.apply(assign_quadrant, axis=1)
-
 # Quadrant colors
 quadrant_colors = {
     'Low Cost / High Context\n(Budget Champions)': '#2ecc71',  # Green
@@ -147,9 +135,8 @@ ax.grid(True, alpha=0.3, which='both')
 ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0,
           frameon=True, shadow=True, fontsize=11)
 
-plt.tight_layout()
 plt.savefig('/home/daniel/repos/github/OR-Models-With-Tools-0811/analysis/cost_vs_context_quadrants.png',
-            dpi=300, bbox_inches='tight')
+            dpi=300)
 print("✓ Saved: analysis/cost_vs_context_quadrants.png")
 plt.close()
 
@@ -170,8 +157,7 @@ for quadrant in quadrant_colors.keys():
 
     # Show top 5 models in this quadrant by context/cost ratio
     if len(quad_data) > 0:
-        quad_data['value_score'] = quad_data['context_length'] / quad_data['avg_cost']
-        top_5 = quad_data.nlargest(5, 'value_score')[['model_name', 'vendor', 'context_length', 'avg_cost', 'value_score']]
+        top_5 = top_by_value(quad_data, 5)[['model_name', 'vendor', 'context_length', 'avg_cost', 'value_score']]
         print("\n  Top 5 by value (context/cost):")
         for idx, row in top_5.iterrows():
             print(f"    - {row['model_name'][:50]} ({row['vendor']})")
@@ -6,10 +6,20 @@ Output:
 2-5. Individual plots for each quadrant with model details
 """
 
+import hashlib
+import importlib.metadata
+import multiprocessing
+import os
+import shutil
+from pathlib import Path
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; charts are only saved to disk
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+from _style import set_whitegrid_style
+from _load import load_models, CSV_PATH
+from _quadrants import compute_quadrants, top_by_value
 try:
     from adjustText import adjust_text
     ADJUST_TEXT_AVAILABLE = True
@@ -18,43 +28,21 @@ except ImportError:
     print("Note: adjustText not available, labels may overlap")
 
 # Set style for better-looking plots
-sns.set_style("whitegrid")
+set_whitegrid_style()
 plt.rcParams['font.size'] = 10
+plt.ioff()
 
-# Load data
-df = pd.read_csv('/home/daniel/repos/github/OR-Models-With-Tools-0811/data/parsed/all-models.csv')
+ANALYSIS_DIR = '/home/daniel/repos/github/OR-Models-With-Tools-0811/analysis'
+CHART_CACHE_DIR = os.path.join(ANALYSIS_DIR, '.cache')
 
-# Calculate average cost (input + output) / 2
-df['avg_cost'] = (df['input_price_usd_per_m'] + df['output_price_usd_per_m']) / 2
+# PNG resolution; 150 dpi is sharp on screen at a quarter of 300 dpi's pixels
+DPI = int(os.environ.get('QUADRANT_DPI', 150))
 
-# Remove models with 0 cost (free tier)
-df_paid = df[df['avg_cost'] > 0].copy()
-
-# Calculate median values for quadrant divisions
-median_context = df_paid['context_length'].median()
-median_cost = df_paid['avg_cost'].median()
-
-print(f"Median context: {median_context:,.0f} tokens ({median_context/1000:.0f}K)")
-print(f"Median cost: ${median_cost:.2f}/M tokens")
-
-# Define quadrants
-def assign_quadrant(row):
-    if row['avg_cost'] < median_cost and row['context_length'] >= median_context:
-        return 'Low Cost / High Context'
-    elif row['avg_cost'] >= median_cost and row['context_length'] >= median_context:
-        return 'High Cost / High Context'
-    elif row['avg_cost'] < median_cost and row['context_length'] < median_context:
-        return 'Low Cost / Low Context'
-    else:
-        return 'High Cost / Low Context'
-
-df_paid['quadrant'] = df_paid.apply(assign_quadrant, axis=1)
-
-# ============================================================================
-# Visualization 1: Overview Map with Quadrant Labels
-# ============================================================================
-
-fig, ax = plt.subplots(figsize=(14, 10))
+# Files whose contents determine the rendered charts
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CHART_INPUTS = [CSV_PATH] + [SCRIPTS_DIR / name for name in (
+    'visualize_quadrants_separate.py', '_load.py', '_quadrants.py', '_style.py'
+)]
 
 # Quadrant colors (muted for overview)
 quadrant_info = {
@@ -64,126 +52,178 @@ quadrant_info = {
     'High Cost / Low Context': {'color': '#e74c3c', 'label': 'High Cost / Low Context'}
 }
 
-# Plot all points in light gray first
-ax.scatter(
-    df_paid['context_length'] / 1000,
-    df_paid['avg_cost'],
-    alpha=0.2,
-    s=50,
-    color='gray',
-    edgecolors='none'
-)
-
-# Add quadrant dividing lines
-ax.axvline(x=median_context/1000, color='black', linestyle='-', linewidth=2.5, alpha=0.7)
-ax.axhline(y=median_cost, color='black', linestyle='-', linewidth=2.5, alpha=0.7)
-
-# Logarithmic scale
-ax.set_xscale('log')
-ax.set_yscale('log')
-
-# Labels
-ax.set_xlabel('Context Window (K tokens, log scale)', fontsize=14, fontweight='bold')
-ax.set_ylabel('Average Cost ($/M tokens, log scale)', fontsize=14, fontweight='bold')
-ax.set_title('LLM Cost vs Context Window: Quadrant Overview',
-             fontsize=16, fontweight='bold', pad=20)
-
-# Grid
-ax.grid(True, alpha=0.3, which='both')
-
-# Add quadrant labels as text annotations
-# Get axis limits for positioning
-xlim = ax.get_xlim()
-ylim = ax.get_ylim()
-
-# Calculate positions (in log space, use geometric mean)
-x_low = np.exp((np.log(xlim[0]) + np.log(median_context/1000)) / 2)
-x_high = np.exp((np.log(median_context/1000) + np.log(xlim[1])) / 2)
-y_low = np.exp((np.log(ylim[0]) + np.log(median_cost)) / 2)
-y_high = np.exp((np.log(median_cost) + np.log(ylim[1])) / 2)
-
-# Quadrant labels with counts
-for quadrant, info in quadrant_info.items():
-    count = len(df_paid[df_paid['quadrant'] == quadrant])
-
-    if quadrant == 'Low Cost / High Context':
-        x_pos, y_pos = x_high, y_low
-    elif quadrant == 'High Cost / High Context':
-        x_pos, y_pos = x_high, y_high
-    elif quadrant == 'Low Cost / Low Context':
-        x_pos, y_pos = x_low, y_low
-    else:  # High Cost / Low Context
-        x_pos, y_pos = x_low, y_high
-
-    ax.text(x_pos, y_pos,
-            f"{info['label']}\n({count} models)",
-            fontsize=14, fontweight='bold',
-            ha='center', va='center',
-            bbox=dict(boxstyle='round,pad=0.8', facecolor=info['color'],
-                     edgecolor='black', linewidth=2, alpha=0.8),
-            color='white')
-
-plt.tight_layout()
-plt.savefig('/home/daniel/repos/github/OR-Models-With-Tools-0811/analysis/quadrant_overview.png',
-            dpi=300, bbox_inches='tight')
-print("✓ Saved: analysis/quadrant_overview.png")
-plt.close()
-
-# ============================================================================
-# Visualizations 2-5: Individual Quadrant Details
-# ============================================================================
-
-for quadrant, info in quadrant_info.items():
-    quad_data = df_paid[df_paid['quadrant'] == quadrant].copy()
-
-    if len(quad_data) == 0:
-        continue
-
-    fig, ax = plt.subplots(figsize=(16, 12))
-
-    # Plot all points in the quadrant color
-    ax.scatter(
-        quad_data['context_length'] / 1000,
-        quad_data['avg_cost'],
-        alpha=0.6,
-        s=100,
-        color=info['color'],
-        edgecolors='black',
-        linewidth=0.8
+
+def quadrant_chart_name(quadrant):
+    """Sanitized PNG filename for a quadrant's detail chart."""
+    filename = quadrant.lower().replace(' / ', '_').replace(' ', '_')
+    return f"quadrant_{filename}.png"
+
+
+def chart_cache_key():
+    """Hash the input data, plotting code and libraries the charts depend on."""
+    adjust_text_version = (importlib.metadata.version('adjustText')
+                           if ADJUST_TEXT_AVAILABLE else 'unavailable')
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{DPI}|matplotlib {matplotlib.__version__}|adjustText {adjust_text_version}".encode())
+    for path in CHART_INPUTS:
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()
+
+
+# Detail figure reused across the quadrants a worker process renders
+_quadrant_figure = None
+
+
+def get_quadrant_axes():
+    """Return this process's quadrant figure with freshly cleared axes."""
+    global _quadrant_figure
+    if _quadrant_figure is None:
+        _quadrant_figure, _ = plt.subplots(figsize=(16, 12))
+    # tight_layout starts from the current subplot params, so reset them to the
+    # rc defaults; otherwise a chart depends on what this worker drew before
+    _quadrant_figure.subplots_adjust(**{
+        param: plt.rcParams[f'figure.subplot.{param}']
+        for param in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+    })
+    ax = _quadrant_figure.axes[0]
+    ax.clear()
+    return _quadrant_figure, ax
+
+
+def render_overview(df_paid, quadrant_groups, median_context, median_cost):
+    """Visualization 1: Overview map with quadrant labels."""
+    fig, ax = plt.subplots(figsize=(14, 10))
+
+    # Background density of all models as log-spaced gray hexagons; drawing
+    # cost scales with the number of occupied cells rather than with models.
+    # vmin=0 keeps single-model cells visibly gray instead of white. Log bins
+    # can't hold a zero context, so those models are left out, as the old
+    # log-scale scatter skipped them
+    plotted = df_paid[df_paid['context_k'] > 0]
+    ax.hexbin(
+        plotted['context_k'],
+        plotted['avg_cost'],
+        xscale='log',
+        yscale='log',
+        gridsize=40,
+        cmap='Greys',
+        mincnt=1,
+        vmin=0,
+        edgecolors='face',
+        alpha=0.5
     )
 
+    # Add quadrant dividing lines
+    ax.axvline(x=median_context/1000, color='black', linestyle='-', linewidth=2.5, alpha=0.7)
+    ax.axhline(y=median_cost, color='black', linestyle='-', linewidth=2.5, alpha=0.7)
+
+    # Logarithmic scale
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+
+    # Labels
+    ax.set_xlabel('Context Window (K tokens, log scale)', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Average Cost ($/M tokens, log scale)', fontsize=14, fontweight='bold')
+    ax.set_title('LLM Cost vs Context Window: Quadrant Overview',
+                 fontsize=16, fontweight='bold', pad=20)
+
+    # Grid
+    ax.grid(True, alpha=0.3, which='both')
+
+    # Add quadrant labels as text annotations
+    # Get axis limits for positioning
+    xlim = ax.get_xlim()
+    ylim = ax.get_ylim()
+
+    # Calculate positions (in log space, use geometric mean)
+    x_low = np.exp((np.log(xlim[0]) + np.log(median_context/1000)) / 2)
+    x_high = np.exp((np.log(median_context/1000) + np.log(xlim[1])) / 2)
+    y_low = np.exp((np.log(ylim[0]) + np.log(median_cost)) / 2)
+    y_high = np.exp((np.log(median_cost) + np.log(ylim[1])) / 2)
+
+    # Quadrant labels with counts
+    for quadrant, info in quadrant_info.items():
+        count = len(quadrant_groups.get(quadrant, ()))
+
+        if quadrant == 'Low Cost / High Context':
+            x_pos, y_pos = x_high, y_low
+        elif quadrant == 'High Cost / High Context':
+            x_pos, y_pos = x_high, y_high
+        elif quadrant == 'Low Cost / Low Context':
+            x_pos, y_pos = x_low, y_low
+        else:  # High Cost / Low Context
+            x_pos, y_pos = x_low, y_high
+
+        ax.text(x_pos, y_pos,
+                f"{info['label']}\n({count} models)",
+                fontsize=14, fontweight='bold',
+                ha='center', va='center',
+                bbox=dict(boxstyle='round,pad=0.8', facecolor=info['color'],
+                         edgecolor='black', linewidth=2, alpha=0.8),
+                color='white')
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(ANALYSIS_DIR, 'quadrant_overview.png'),
+                dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return 'quadrant_overview.png'
+
+
+def render_quadrant(quadrant, info, quad_data, stats):
+    """Visualizations 2-5: Detail plot for one quadrant; stats is its summary row."""
+    fig, ax = get_quadrant_axes()
+
+    # Plot all points in the quadrant color. Every marker is styled the same, so
+    # small quadrants use a single Line2D (one marker path stamped per point),
+    # which draws faster than a PathCollection; markersize 10 matches s=100
+    if len(quad_data) < 200:
+        ax.plot(
+            quad_data['context_k'],
+            quad_data['avg_cost'],
+            'o',
+            linestyle='',
+            alpha=0.6,
+            markersize=10,
+            markerfacecolor=info['color'],
+            markeredgecolor='black',
+            markeredgewidth=0.8
+        )
+    else:
+        ax.scatter(
+            quad_data['context_k'],
+            quad_data['avg_cost'],
+            alpha=0.6,
+            s=100,
+            color=info['color'],
+            edgecolors='black',
+            linewidth=0.8
+        )
+
     # Add labels for each model
-    # For models, extract a short name from model_name (before first parenthesis or colon)
+    # Short name is the part after the first colon (e.g., "OpenAI: GPT-4" -> "GPT-4")
+    name_parts = quad_data['model_name'].str.partition(':')
+    short_names = name_parts[2].str.strip().where(name_parts[1] == ':', quad_data['model_name'])
+
+    # Limit length
+    short_names = short_names.where(short_names.str.len() <= 40, short_names.str.slice(0, 37) + '...')
+
     texts = []
-    for idx, row in quad_data.iterrows():
-        # Extract short model name
-        model_name = row['model_name']
-        # Try to get the part after the first colon (e.g., "OpenAI: GPT-4" -> "GPT-4")
-        if ':' in model_name:
-            short_name = model_name.split(':', 1)[1].strip()
-        else:
-            short_name = model_name
-
-        # Limit length
-        if len(short_name) > 40:
-            short_name = short_name[:37] + '...'
-
-        text = ax.text(
-            row['context_length'] / 1000,
-            row['avg_cost'],
-            short_name,
-            fontsize=7,
-            alpha=0.8
-        )
+    for x, y, short_name in zip(quad_data['context_k'].to_numpy(),
+                                quad_data['avg_cost'].to_numpy(),
+                                short_names.to_numpy()):
+        text = ax.text(x, y, short_name, fontsize=7, alpha=0.8)
         texts.append(text)
 
     # Adjust text to avoid overlaps (this may take a moment)
     if ADJUST_TEXT_AVAILABLE:
         try:
-            adjust_text(texts, arrowprops=dict(arrowstyle='-', color='gray', lw=0.5, alpha=0.5))
-        except:
-            # If adjust_text fails, just skip the adjustment
-            pass
+            # Bound the repulsion per chart at 2 s so a pathological layout can't
+            # stall a worker; normal quadrants finish before the limit
+            adjust_text(texts, time_lim=2,
+                        arrowprops=dict(arrowstyle='-', color='gray', lw=0.5, alpha=0.5))
+        except Exception as e:
+            # Keep the chart with unadjusted labels rather than failing the run
+            print(f"Note: adjust_text failed for {quadrant} ({e}), labels may overlap")
 
     # Logarithmic scale
     ax.set_xscale('log')
@@ -205,11 +245,11 @@ for quadrant, info in quadrant_info.items():
     # Add summary statistics box
     stats_text = (
         f"Statistics:\n"
-        f"Models: {len(quad_data)}\n"
-        f"Avg Cost: ${quad_data['avg_cost'].mean():.2f}/M\n"
-        f"Cost Range: ${quad_data['avg_cost'].min():.2f} - ${quad_data['avg_cost'].max():.2f}\n"
-        f"Avg Context: {quad_data['context_length'].mean()/1000:.0f}K\n"
-        f"Context Range: {quad_data['context_length'].min()/1000:.0f}K - {quad_data['context_length'].max()/1000:.0f}K"
+        f"Models: {stats['count']:.0f}\n"
+        f"Avg Cost: ${stats['cost_mean']:.2f}/M\n"
+        f"Cost Range: ${stats['cost_min']:.2f} - ${stats['cost_max']:.2f}\n"
+        f"Avg Context: {stats['ctx_mean']:.0f}K\n"
+        f"Context Range: {stats['ctx_min']:.0f}K - {stats['ctx_max']:.0f}K"
     )
 
     ax.text(0.02, 0.98, stats_text,
@@ -219,23 +259,112 @@ for quadrant, info in quadrant_info.items():
             bbox=dict(boxstyle='round', facecolor='white',
                      edgecolor='black', linewidth=1.5, alpha=0.9))
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save with sanitized filename
-    filename = quadrant.lower().replace(' / ', '_').replace(' ', '_')
-    filepath = f'/home/daniel/repos/github/OR-Models-With-Tools-0811/analysis/quadrant_{filename}.png'
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    print(f"✓ Saved: analysis/quadrant_{filename}.png")
-    plt.close()
-
-    # Print top models in this quadrant
-    print(f"\n{quadrant} - Top 10 models by value (context/cost):")
-    quad_data['value_score'] = quad_data['context_length'] / quad_data['avg_cost']
-    top_10 = quad_data.nlargest(10, 'value_score')[['model_name', 'vendor', 'context_length', 'avg_cost']]
-    for idx, (i, row) in enumerate(top_10.iterrows(), 1):
-        print(f"  {idx}. {row['model_name'][:60]} ({row['vendor']})")
-        print(f"     Context: {row['context_length']/1000:.0f}K | Cost: ${row['avg_cost']:.2f}/M")
-
-print("\n" + "="*70)
-print("All visualizations complete!")
-print("="*70)
+    chart_name = quadrant_chart_name(quadrant)
+    fig.savefig(os.path.join(ANALYSIS_DIR, chart_name), dpi=DPI, bbox_inches='tight')
+    return chart_name
+
+
+def main():
+    """Render the overview and per-quadrant charts and print top models."""
+    # Load data from the columnar cache, reading only the columns used here.
+    # avg_cost is the loader's float64 value, so printed costs round exactly as
+    # in the other scripts; context fits in int32 and vendor repeats, so it is
+    # stored as a category
+    df = load_models(columns=['model_name', 'vendor', 'context_length', 'avg_cost'])
+    df = df.astype({'context_length': 'int32',
+                    'model_name': 'string',
+                    'vendor': 'category'})
+
+    # Keep paid models and assign quadrants with vectorized masks
+    df_paid, median_context, median_cost = compute_quadrants(df)
+
+    # Context window in thousands of tokens, scaled once for plotting and printing
+    df_paid['context_k'] = df_paid['context_length'].to_numpy(dtype='float32') / 1000
+
+    print(f"Median context: {median_context:,.0f} tokens ({median_context/1000:.0f}K)")
+    print(f"Median cost: ${median_cost:.2f}/M tokens")
+
+    # Partition the paid models by quadrant once (value_score is already computed)
+    quadrant_groups = dict(tuple(df_paid.groupby('quadrant', observed=True, sort=False)))
+
+    # Summary statistics for every quadrant in a single grouped pass
+    quadrant_stats = df_paid.groupby('quadrant', observed=True).agg(
+        count=('avg_cost', 'size'),
+        cost_mean=('avg_cost', 'mean'),
+        cost_min=('avg_cost', 'min'),
+        cost_max=('avg_cost', 'max'),
+        ctx_mean=('context_k', 'mean'),
+        ctx_min=('context_k', 'min'),
+        ctx_max=('context_k', 'max'),
+    )
+
+    # Reuse previously rendered charts when the data and plotting code are unchanged
+    chart_names = ['quadrant_overview.png'] + [
+        quadrant_chart_name(quadrant) for quadrant in quadrant_info if quadrant in quadrant_groups
+    ]
+    cache_key = chart_cache_key()
+    chart_cache = os.path.join(CHART_CACHE_DIR, cache_key)
+    charts_cached = all(os.path.exists(os.path.join(chart_cache, name)) for name in chart_names)
+
+    if charts_cached:
+        for name in chart_names:
+            shutil.copyfile(os.path.join(chart_cache, name), os.path.join(ANALYSIS_DIR, name))
+            print(f"✓ Restored from cache: analysis/{name}")
+    else:
+        # Each chart is independent, so render them in parallel worker processes;
+        # workers return the saved filename and the parent reports it
+        tasks = [(quadrant, info, quadrant_groups[quadrant], quadrant_stats.loc[quadrant])
+                 for quadrant, info in quadrant_info.items() if quadrant in quadrant_groups]
+        with multiprocessing.Pool(min(4, len(tasks) + 1)) as pool:
+            # Submit everything before waiting so the overview overlaps the details
+            overview = pool.apply_async(render_overview,
+                                        (df_paid, quadrant_groups, median_context, median_cost))
+            quadrants = pool.starmap_async(render_quadrant, tasks)
+            saved = [overview.get()] + quadrants.get()
+        for name in saved:
+            print(f"✓ Saved: analysis/{name}")
+
+    for quadrant, info in quadrant_info.items():
+        quad_data = quadrant_groups.get(quadrant)
+
+        if quad_data is None:
+            continue
+
+        # Print top models in this quadrant
+        print(f"\n{quadrant} - Top 10 models by value (context/cost):")
+        top_10 = top_by_value(quad_data, 10)
+        # Let pandas lay out the table; every column is left-aligned to its
+        # header, and numbers use the same .0f/.2f rounding as the other scripts
+        table = pd.DataFrame({
+            'Model': top_10['model_name'].str.slice(0, 60),
+            'Vendor': top_10['vendor'],
+            'Context (K)': top_10['context_k'],
+            'Cost ($/M)': top_10['avg_cost'],
+        })
+        print(table.to_string(index=False, justify='left', formatters={
+            'Model': '{:<60}'.format,
+            'Vendor': '{:<16}'.format,
+            'Context (K)': '{:<11.0f}'.format,
+            'Cost ($/M)': '{:<10.2f}'.format,
+        }))
+
+    # Store freshly rendered charts for the next run with the same inputs, and
+    # drop charts cached for older inputs so the cache holds one set at most
+    if not charts_cached:
+        os.makedirs(chart_cache, exist_ok=True)
+        for name in chart_names:
+            shutil.copyfile(os.path.join(ANALYSIS_DIR, name), os.path.join(chart_cache, name))
+        for entry in os.listdir(CHART_CACHE_DIR):
+            if entry != cache_key:
+                shutil.rmtree(os.path.join(CHART_CACHE_DIR, entry), ignore_errors=True)
+
+    print("\n" + "="*70)
+    print("All visualizations complete!")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()